@@ -122,7 +122,10 @@ if (bgImg) {
     if (!bgImg) return;
 
     const results = await Promise.all(rawImages.map(preloadOne));
-    bgImages = results.filter((r) => r.ok).map((r) => r.src);
+    bgImages = [];
+    for (const r of results) {
+      if (r.ok) bgImages.push(r.src);
+    }
 
     log("preload results:", results);
     log("valid images:", bgImages);
@@ -328,12 +331,18 @@ if (bgImg) {
   let view = new Date();
   let selected = null;
 
+  // built once; fmtDateLine runs every second via tickClock
+  const dayNames = ["Sun","Mon","Tue","Wed","Thu","Fri","Sat"];
+  const monthAbbr = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"];
+  const monthNames = [
+    "January","February","March","April","May","June",
+    "July","August","September","October","November","December"
+  ];
+
   function pad(n) { return String(n).padStart(2, "0"); }
 
   function fmtDateLine(d) {
-    const days = ["Sun","Mon","Tue","Wed","Thu","Fri","Sat"];
-    const months = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"];
-    return `${days[d.getDay()]}, ${months[d.getMonth()]} ${d.getDate()}, ${d.getFullYear()}`;
+    return `${dayNames[d.getDay()]}, ${monthAbbr[d.getMonth()]} ${d.getDate()}, ${d.getFullYear()}`;
   }
 
   function tickClock() {
@@ -348,10 +357,6 @@ if (bgImg) {
     const year = view.getFullYear();
     const month = view.getMonth();
 
-    const monthNames = [
-      "January","February","March","April","May","June",
-      "July","August","September","October","November","December"
-    ];
     calMonth.textContent = `${monthNames[month]} ${year}`;
 
     calGrid.innerHTML = "";